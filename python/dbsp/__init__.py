@@ -1,20 +1,73 @@
-from .project import DBSPProject
-from .pipeline import DBSPPipeline
-from .config import DBSPPipelineConfig
-from .error import DBSPServerError
-from .error import TimeoutException
-from .error import CompilationException
-from .connection import DBSPConnection
-from .connector import DBSPConnector
-from .connector import CsvInputFormatConfig
-from .connector import CsvOutputFormatConfig
-from .connector import CsvParserConfig
-from .connector import CsvEncoderConfig
-from .connector import KafkaInputConfig
-from .connector import KafkaOutputConfig
-from .connector import FileInputConfig
-from .connector import FileOutputConfig
-from .connector import FormatConfig
-from .connector import InputEndpointConfig
-from .connector import OutputEndpointConfig
-from .connector import TransportConfig
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodules that define them.  Submodules, along with
+# the generated `dbsp_api_client` models they depend on, are imported the
+# first time one of their names is accessed (PEP 562), so `import dbsp` by
+# itself stays cheap.
+_EXPORTS = {
+    'DBSPProject': 'project',
+    'DBSPPipeline': 'pipeline',
+    'DBSPPipelineConfig': 'config',
+    'DBSPServerError': 'error',
+    'TimeoutException': 'error',
+    'CompilationException': 'error',
+    'DBSPConnection': 'connection',
+    'DBSPConnector': 'connector',
+    'CsvInputFormatConfig': 'connector',
+    'CsvOutputFormatConfig': 'connector',
+    'CsvParserConfig': 'connector',
+    'CsvEncoderConfig': 'connector',
+    'KafkaInputConfig': 'connector',
+    'KafkaOutputConfig': 'connector',
+    'FileInputConfig': 'connector',
+    'FileOutputConfig': 'connector',
+    'FormatConfig': 'connector',
+    'InputEndpointConfig': 'connector',
+    'OutputEndpointConfig': 'connector',
+    'TransportConfig': 'connector',
+}
+
+# Submodules stay reachable as attributes, e.g., `dbsp.config`, as they were
+# when the package imported them eagerly.
+_SUBMODULES = frozenset(_EXPORTS.values())
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from .project import DBSPProject
+    from .pipeline import DBSPPipeline
+    from .config import DBSPPipelineConfig
+    from .error import DBSPServerError
+    from .error import TimeoutException
+    from .error import CompilationException
+    from .connection import DBSPConnection
+    from .connector import DBSPConnector
+    from .connector import CsvInputFormatConfig
+    from .connector import CsvOutputFormatConfig
+    from .connector import CsvParserConfig
+    from .connector import CsvEncoderConfig
+    from .connector import KafkaInputConfig
+    from .connector import KafkaOutputConfig
+    from .connector import FileInputConfig
+    from .connector import FileOutputConfig
+    from .connector import FormatConfig
+    from .connector import InputEndpointConfig
+    from .connector import OutputEndpointConfig
+    from .connector import TransportConfig
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module('.' + name, __name__)
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _SUBMODULES)
@@ -1,6 +1,6 @@
 import uuid
-import dbsp_api_client
-import yaml
+import json
+import logging
 import sys
 
 from dbsp_api_client.models.pipeline_config import PipelineConfig
@@ -26,11 +26,16 @@ from dbsp.project import DBSPProject
 from dbsp.error import TimeoutException
 from dbsp.connector import DBSPConnector
 
+logger = logging.getLogger(__name__)
+
 
 class DBSPPipelineConfig:
     """Pipeline configuration specified by the user when creating
     a new pipeline instance."""
 
+    __slots__ = ('project', 'api_client', 'pipeline_config', 'config_id', 'config_version',
+                 'attached_connectors', 'pipeline_id', 'name', 'description', '_saved_state')
+
     def __init__(self, project: DBSPProject, workers: int, name: str = '<anon>', description: str = ''):
         self.project = project
         self.api_client = self.project.api_client
@@ -45,6 +50,8 @@ class DBSPPipelineConfig:
         self.pipeline_id = None
         self.name = name
         self.description = description
+        # Everything sent to the server by the last successful `save()`.
+        self._saved_state = None
 
     def add_input(self, stream: str, connector: DBSPConnector):
         """Add an input endpoint to the pipeline configuration.
@@ -164,20 +171,39 @@ class DBSPPipelineConfig:
 
     def yaml(self) -> str:
         """Convert pipeline configuration to YAML format."""
-        config = self.pipeline_config.to_dict().copy()
+        config = self.pipeline_config.to_dict()
         del config['inputs']
         del config['outputs']
-        return yaml.dump(config)
+        # The server splices connector configs into this string line by
+        # line, so it must remain block-style YAML.  Emit one `key: value`
+        # line per setting, with values encoded as JSON, which is valid
+        # YAML, instead of going through the YAML emitter.
+        return ''.join(key + ': ' + json.dumps(value) + '\n' for key, value in config.items())
 
     def save(self):
-        "Save the pipeline configuration to DBSP."
-        # print("yaml:\n" + self.yaml())
+        """Save the pipeline configuration to DBSP.
+
+        Does nothing if the configuration has not changed since the last save.
+        """
+        # Compare against the current contents of `pipeline_config`, so that
+        # direct edits to it are always sent to the server.
+        state = {
+            'project_id': self.project.project_id,
+            'name': self.name,
+            'description': self.description,
+            'config': self.yaml(),
+            'connectors': [connector.to_dict() for connector in self.attached_connectors],
+        }
+        if state == self._saved_state:
+            return
+
+        logger.debug("Pipeline config YAML:\n%s", state['config'])
         if self.config_id == None:
             body = NewConfigRequest(
                 project_id=self.project.project_id,
                 name=self.name,
                 description=self.description,
-                config=self.yaml(),
+                config=state['config'],
                 connectors=self.attached_connectors,
             )
             response = new_config.sync_detailed(client=self.api_client, json_body=body).unwrap(
@@ -190,12 +216,13 @@ class DBSPPipelineConfig:
                 project_id=self.project.project_id,
                 name=self.name,
                 description=self.description,
-                config=self.yaml(),
+                config=state['config'],
                 connectors=self.attached_connectors,
             )
             response = update_config.sync_detailed(
                 client=self.api_client, json_body=body).unwrap("Failed to update pipeline config")
             self.config_version = response.version
+        self._saved_state = state
 
     def run(self) -> DBSPPipeline:
         """Launch a new pipeline.
@@ -1,4 +1,5 @@
 import dbsp_api_client
+import httpx
 
 from dbsp_api_client.models.new_project_request import NewProjectRequest
 from dbsp_api_client.api.project import list_projects
@@ -8,6 +9,12 @@ from dbsp.project import DBSPProject
 class DBSPConnection:
     """DBSP server connection.
 
+    All requests issued through this connection share a single pool of
+    keep-alive HTTP connections, which is created lazily on first use.
+    HTTP/2 is negotiated for `https://` URLs, allowing concurrent requests,
+    e.g., from `DBSPProject.compile_async`, to be multiplexed over one
+    connection.
+
     Args:
         url (str): URL of the DBSP server.
     """
@@ -15,7 +22,11 @@ class DBSPConnection:
     def __init__(self, url="http://localhost:8080"):
         self.api_client = dbsp_api_client.Client(
                 base_url = url,
-                timeout = 20.0)
+                timeout = 20.0,
+                httpx_args = {
+                    "http2": True,
+                    "limits": httpx.Limits(max_connections = 100, max_keepalive_connections = 20),
+                })
 
         list_projects.sync_detailed(client = self.api_client).unwrap("Failed to fetch project list from the DBSP server")
 
@@ -1,10 +1,11 @@
 from typing import Any, Dict
-import dbsp_api_client
 import yaml
 
-from dbsp_api_client.models.pipeline_config import PipelineConfig
-from dbsp_api_client.models.pipeline_config_inputs import PipelineConfigInputs
-from dbsp_api_client.models.pipeline_config_outputs import PipelineConfigOutputs
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 from dbsp_api_client.models.transport_config import TransportConfig
 from dbsp_api_client.models.format_config import FormatConfig
 from dbsp_api_client.models.input_endpoint_config import InputEndpointConfig
@@ -14,20 +15,24 @@ from dbsp_api_client.models.kafka_output_config import KafkaOutputConfig
 from dbsp_api_client.models.file_input_config import FileInputConfig
 from dbsp_api_client.models.file_output_config import FileOutputConfig
 from dbsp_api_client.models.csv_parser_config import CsvParserConfig
-from dbsp_api_client.models.new_config_request import NewConfigRequest
 from dbsp_api_client.models.new_connector_request import NewConnectorRequest
 from dbsp_api_client.models.update_connector_request import UpdateConnectorRequest
-from dbsp_api_client.models.direction import Direction
 from dbsp_api_client.models.connector_type import ConnectorType
 from dbsp_api_client.models.csv_encoder_config import CsvEncoderConfig
 from dbsp_api_client.api.connector import new_connector
 from dbsp_api_client.api.connector import update_connector
 from dbsp_api_client.api.connector import delete_connector
+# Installs `Response.unwrap`, now that the package no longer imports every
+# submodule eagerly.
+import dbsp.error
 
 
 class DBSPConnector:
     "A connector that can be attached to configs."
 
+    __slots__ = ('api_client', 'connector_id', 'name', 'description', 'typ', 'transport', 'format',
+                 'config')
+
     def __init__(self, api_client, name: str, typ: ConnectorType, transport: "TransportConfig", format: "FormatConfig", description: str = ''):
         self.api_client = api_client
 
@@ -60,7 +65,7 @@ class DBSPConnector:
                 name=self.name,
                 description=self.description,
                 typ=self.typ,
-                config=yaml.dump(self.config),
+                config=yaml.dump(self.config, Dumper=SafeDumper, default_flow_style=False),
             )
             response = new_connector.sync_detailed(
                 client=self.api_client, json_body=body).unwrap("Failed to create the connector")
@@ -71,7 +76,7 @@ class DBSPConnector:
                 name=self.name,
                 description=self.description,
                 typ=self.typ,
-                config=yaml.dump(self.config),
+                config=yaml.dump(self.config, Dumper=SafeDumper, default_flow_style=False),
             )
             response = update_connector.sync_detailed(
                 client=self.api_client, json_body=body).unwrap("Failed to update the connector")
@@ -79,8 +84,9 @@ class DBSPConnector:
     def delete(self):
         "Delete the existing connector."
         if self.connector_id is not None:
-            delete_connector.sync_detailed(connector_id=self.connector_id).unwrap(
-                "Failed to add the connector")
+            delete_connector.sync_detailed(
+                client=self.api_client, connector_id=self.connector_id).unwrap("Failed to delete the connector")
+            self.connector_id = None
 
 
 class CsvInputFormatConfig(FormatConfig):
@@ -8,13 +8,16 @@ class DBSPServerError(Exception):
     def __init__(self, response: Response, description: str):
         self.description = description
         self.response = response
+        super().__init__(response, description)
 
-        if isinstance(response.parsed, ErrorResponse):
-            response_body = response.parsed.message
+    def __str__(self):
+        # Build the message on demand, so callers that catch and retry
+        # don't pay for formatting it.
+        if isinstance(self.response.parsed, ErrorResponse):
+            response_body = self.response.parsed.message
         else:
-            response_body = str(response.parsed)
-        message = description + "\nHTTP response code: " + str(response.status_code) + "\nResponse body: " + response_body 
-        super().__init__(message)
+            response_body = str(self.response.parsed)
+        return f"{self.description}\nHTTP response code: {self.response.status_code}\nResponse body: {response_body}"
 
 class CompilationException(Exception):
     """Error returned by the DBSP compiler.
@@ -40,12 +43,12 @@ class TimeoutException(Exception):
     pass
 
 # Add a method to the `Response` class to throw an error when the HTTP
-# status in the response is not not a success.
+# status in the response is not a success.  httpx never returns
+# informational (1xx) responses, so any status below 300 is a success.
 def unwrap(self, description = "DBSP request failed"):
-    if 200 <= self.status_code <= 202:
+    if self.status_code < 300:
         return self.parsed
-    else:
-        raise DBSPServerError(response = self, description = description)
+    raise DBSPServerError(response = self, description = description)
 
 Response.unwrap = unwrap
 
@@ -1,4 +1,4 @@
-import dbsp_api_client
+import copy
 import time
 import sys
 
@@ -14,14 +14,26 @@ from dbsp_api_client.models.shutdown_pipeline_request import ShutdownPipelineReq
 from dbsp.error import TimeoutException
 
 
+# How long (in seconds) a pipeline status response is reused before
+# querying the server again.
+STATUS_TTL = 0.1
+
+
 class DBSPPipeline:
     """DBSP pipeline instance.
     """
 
+    __slots__ = ('api_client', 'pipeline_id', 'config', '_metadata', '_status', '_status_time')
+
     def __init__(self, config, api_client: Client, pipeline_id: int):
         self.api_client = api_client
         self.pipeline_id = pipeline_id
         self.config = config
+        # Pipeline metadata never changes once the pipeline is created, so
+        # it is retrieved at most once.  Status is cached for STATUS_TTL.
+        self._metadata = None
+        self._status = None
+        self._status_time = 0.0
         pipeline_start.sync_detailed(
             client=self.api_client, pipeline_id=self.pipeline_id).unwrap("Failed to start pipeline")
 
@@ -34,6 +46,7 @@ class DBSPPipeline:
         """
         pipeline_pause.sync_detailed(
             client=self.api_client, pipeline_id=self.pipeline_id).unwrap("Failed to pause pipeline")
+        self._status = None
 
     def start(self):
         """Start paused pipeline.
@@ -44,6 +57,7 @@ class DBSPPipeline:
         """
         pipeline_start.sync_detailed(
             client=self.api_client, pipeline_id=self.pipeline_id).unwrap("Failed to start pipeline")
+        self._status = None
 
 #    def shutdown(self):
 #        """Terminate the execution of a pipeline.
@@ -74,17 +88,26 @@ class DBSPPipeline:
         pipeline_delete.sync_detailed(
             client=self.api_client, pipeline_id=self.pipeline_id).unwrap("Failed to delete pipeline")
         self.config.pipeline_id = None
+        self._status = None
 
     def status(self) -> Dict[str, Any]:
         """Retrieve pipeline status and performance counters.
 
+        Responses are reused for up to STATUS_TTL seconds, so tight polling
+        loops don't issue a request per call.  Each call returns a new copy,
+        which the caller is free to modify.
+
         Raises:
             httpx.TimeoutException: If the request takes longer than Client.timeout.
             dbsp.DBSPServerError: If the DBSP server returns an error.
         """
-        status = pipeline_status.sync_detailed(
-            client=self.api_client, pipeline_id=self.pipeline_id).unwrap("Failed to retrieve pipeline status")
-        return status.additional_properties
+        now = time.monotonic()
+        if self._status is None or now - self._status_time >= STATUS_TTL:
+            status = pipeline_status.sync_detailed(
+                client=self.api_client, pipeline_id=self.pipeline_id).unwrap("Failed to retrieve pipeline status")
+            self._status = status.additional_properties
+            self._status_time = now
+        return copy.deepcopy(self._status)
 
     def wait(self, timeout: float = sys.maxsize):
         """Wait for the pipeline to process all inputs to completion.
@@ -96,9 +119,11 @@ class DBSPPipeline:
             dbsp.DBSPServerError: If the DBSP server returns an error.
             dbsp.TimeoutException: If the pipeline does not terminate within 'timeout' seconds.
         """
-        start = time.time()
-        while time.time() - start < timeout:
-            status = self.status()
+        get_status = self.status
+        monotonic = time.monotonic
+        deadline = monotonic() + timeout
+        while monotonic() < deadline:
+            status = get_status()
             if status['global_metrics']['pipeline_complete'] == True:
                 return
             time.sleep(0.5)
@@ -108,10 +133,29 @@ class DBSPPipeline:
     def metadata(self) -> Dict[str, Any]:
         """Retrieve pipeline metadata.
 
+        Metadata is fixed when the pipeline is created, so it is only
+        retrieved from the server on the first call.  Each call returns a new
+        copy, which the caller is free to modify.
+
+        Raises:
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+            dbsp.DBSPServerError: If the DBSP server returns an error.
+        """
+        if self._metadata is None:
+            meta = pipeline_metadata.sync_detailed(client=self.api_client, pipeline_id=self.pipeline_id).unwrap(
+                "Failed to retrieve pipeline metadata")
+            self._metadata = meta.additional_properties
+        return copy.deepcopy(self._metadata)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Retrieve pipeline status and metadata together.
+
+        Returns:
+            Dict with a 'status' key, as returned by `status()`, and a
+            'metadata' key, as returned by `metadata()`.
+
         Raises:
             httpx.TimeoutException: If the request takes longer than Client.timeout.
             dbsp.DBSPServerError: If the DBSP server returns an error.
         """
-        meta = pipeline_metadata.sync_detailed(client=self.api_client, pipeline_id=self.pipeline_id).unwrap(
-            "Failed to retrieve pipeline metadata")
-        return meta.additional_properties
+        return {'status': self.status(), 'metadata': self.metadata()}
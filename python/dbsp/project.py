@@ -1,12 +1,43 @@
-import dbsp_api_client
-
 from dbsp_api_client.models.compile_project_request import CompileProjectRequest
 from dbsp_api_client.api.project import project_status
 from dbsp_api_client.api.project import compile_project
 from dbsp.error import CompilationException
+from dbsp.error import TimeoutException
+import asyncio
 import time
 import sys
-from typing import Union, Dict, Any
+from typing import Union, Dict, Any, Iterator
+
+
+def _poll_delays() -> Iterator[float]:
+    """Delays between compilation status probes.
+
+    Compilation can take minutes; back off exponentially instead of polling
+    the server at a fixed rate.
+    """
+    delay = 0.25
+    while True:
+        yield delay
+        delay = min(delay * 1.5, 5.0)
+
+
+def _compilation_finished(status) -> bool:
+    """Returns `True` if compilation succeeded and `False` while it is still
+    in progress.
+
+    Raises:
+        dbsp.CompilationException: If the project failed to compile.
+    """
+    if status == 'CompilingSql' or status == 'CompilingRust' or status == 'Pending':
+        return False
+    if status == 'Success':
+        return True
+    raise CompilationException(str(status))
+
+
+def _compilation_timeout(timeout: float) -> TimeoutException:
+    return TimeoutException("Timeout waiting for the project to compile after " + str(timeout) + "s")
+
 
 class DBSPProject:
     """DBSP project
@@ -17,6 +48,8 @@ class DBSPProject:
     compiler.
     """
 
+    __slots__ = ('api_client', 'project_id', 'project_version')
+
     def __init__(self, api_client, project_id, project_version):
         self.api_client = api_client
         self.project_id = project_id
@@ -26,6 +59,8 @@ class DBSPProject:
         """Compile the project
 
         Queue project for compilation and wait for compilation to complete.
+        Returns immediately if the current version of the project has
+        already been compiled successfully.
 
         Args:
             timeout (float): Maximal amount of time to wait for compilation to complete.
@@ -39,24 +74,79 @@ class DBSPProject:
             dbsp.DBSPServerError: If the DBSP server returns an error while queueing the project or probing project status.
         """
 
-        body = CompileProjectRequest(
-            project_id=self.project_id,
-            version=self.project_version,
-        )
+        descr = project_status.sync_detailed(
+                client = self.api_client,
+                project_id = self.project_id).unwrap("Failed to retrieve project status")
+        if self._is_compiled(descr):
+            return
+
         # Queue project for compilation.
-        compile_project.sync_detailed(client = self.api_client, json_body=body).unwrap("Failed to queue project for compilation")
+        compile_project.sync_detailed(client = self.api_client, json_body=self._compile_request()).unwrap(
+            "Failed to queue project for compilation")
+
+        get_status = self.status
+        monotonic = time.monotonic
+        deadline = monotonic() + timeout
+        for delay in _poll_delays():
+            if _compilation_finished(get_status()):
+                return
+            # Never sleep past the deadline; the status is probed one last
+            # time when it is reached.
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise _compilation_timeout(timeout)
+            time.sleep(min(delay, remaining))
+
+    async def compile_async(self, *, timeout: float = sys.maxsize):
+        """Compile the project without blocking the event loop.
+
+        Asynchronous version of `compile()`.  Use it with `asyncio.gather` to
+        compile several projects concurrently over the same connection pool.
+
+        The underlying client caches a single `httpx.AsyncClient`, which is
+        bound to the event loop it was first used in.  All async calls made
+        through the same `DBSPConnection` must therefore run in a single
+        event loop, e.g., one `asyncio.run()` invocation.
+
+        Args:
+            timeout (float): Maximal amount of time to wait for compilation to complete.
 
-        start = time.time()
-        while time.time() - start < timeout:
-            status = self.status()
-            if status != 'CompilingSql' and status != 'CompilingRust' and status != 'Pending':
-                if status == 'Success':
-                    return
-                else:
-                    raise CompilationException(str(status))
-            time.sleep(0.5)
+        Raises:
+            httpx.TimeoutException: If the DBSP server takes too long to respond to a request.
+            dbsp.CompilationException: If the project fails to compile.
+            dbsp.TimeoutException: If the project takes too long to compile.
+            dbsp.DBSPServerError: If the DBSP server returns an error while queueing the project or probing project status.
+        """
 
-        raise TimeoutException("Timeout waiting for the project to compile after " + str(timeout) + "s")
+        descr = (await project_status.asyncio_detailed(
+                client = self.api_client,
+                project_id = self.project_id)).unwrap("Failed to retrieve project status")
+        if self._is_compiled(descr):
+            return
+
+        (await compile_project.asyncio_detailed(client = self.api_client, json_body=self._compile_request())).unwrap(
+            "Failed to queue project for compilation")
+
+        get_status = self.status_async
+        monotonic = time.monotonic
+        deadline = monotonic() + timeout
+        for delay in _poll_delays():
+            if _compilation_finished(await get_status()):
+                return
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                raise _compilation_timeout(timeout)
+            await asyncio.sleep(min(delay, remaining))
+
+    def _is_compiled(self, descr) -> bool:
+        "Checks whether `descr` reports this version of the project as compiled."
+        return descr.version == self.project_version and descr.status == 'Success'
+
+    def _compile_request(self) -> CompileProjectRequest:
+        return CompileProjectRequest(
+            project_id=self.project_id,
+            version=self.project_version,
+        )
 
     # TODO: Convert return type to something more user-friendly.
     def status(self) -> Union[Dict[str, Any], str]:
@@ -72,9 +162,21 @@ class DBSPProject:
         response = project_status.sync_detailed(
                 client = self.api_client,
                 project_id = self.project_id).unwrap("Failed to retrieve project status")
+        return response.status
+
+    async def status_async(self) -> Union[Dict[str, Any], str]:
+        """Asynchronous version of `status()`.
+
+        See `compile_async()` for event loop restrictions.
 
-        # if api_response.body['version'] != self.project_version:
-        #    raise RuntimeError(
-        #            "Project modified on the server.  Expected version: " + self.project_version + ". ") from e
+        Raises:
+            httpx.TimeoutException: If the request takes longer than Client.timeout.
+            dbsp.DBSPServerError: If the DBSP server returns an error.
 
+        Returns:
+            Union[Dict[str, Any], str]
+        """
+        response = (await project_status.asyncio_detailed(
+                client = self.api_client,
+                project_id = self.project_id)).unwrap("Failed to retrieve project status")
         return response.status